@@ -0,0 +1,115 @@
+"""
+Microbenchmark of per-call SDK overhead, excluding the network.
+
+Requests go to an in-process ``httpx.MockTransport`` that returns a canned
+response, so the timings cover URL/param/header preparation, the httpx
+client and response decoding only.
+
+Usage:
+    python benchmarks/request_overhead.py [iterations]
+"""
+
+import sys
+import timeit
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+import httpx
+
+from catalystwells import CatalystWells
+
+
+def make_client() -> CatalystWells:
+    client = CatalystWells(client_id="bench")
+    client.set_tokens({
+        "access_token": "bench-token",
+        "token_type": "Bearer",
+        "expires_in": 3600,
+        "scope": ""
+    })
+    client._http = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+        timeout=30.0
+    )
+    return client
+
+
+# ==================== 1.0.0 per-call path ====================
+# Reproduces the request path before endpoint descriptors: a params dict,
+# f-string URLs, a naive datetime expiry check and Bearer formatting per call.
+
+def baseline_request(
+    client: CatalystWells,
+    token_expiry: datetime,
+    method: str,
+    path: str,
+    **kwargs: Any
+) -> Dict[str, Any]:
+    if token_expiry and token_expiry < datetime.now() + timedelta(seconds=60):
+        raise RuntimeError("benchmark token expired")
+
+    headers = kwargs.pop("headers", {})
+    headers["Authorization"] = f"Bearer {client._access_token}"
+
+    url = f"{client.base_url}{path}"
+    response = client._http.request(method=method, url=url, headers=headers, **kwargs)
+    result = response.json()
+    if response.status_code >= 400:
+        raise RuntimeError(result)
+    return result
+
+
+def baseline_get_student_attendance(
+    client: CatalystWells,
+    token_expiry: datetime,
+    student_id: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    month: Optional[str] = None,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    params = {}
+    if start_date:
+        params["start_date"] = start_date
+    if end_date:
+        params["end_date"] = end_date
+    if month:
+        params["month"] = month
+    if limit:
+        params["limit"] = str(limit)
+
+    return baseline_request(
+        client,
+        token_expiry,
+        "GET",
+        f"/api/v1/attendance/student/{student_id}",
+        params=params
+    )
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    client = make_client()
+    token_expiry = datetime.now() + timedelta(seconds=3600)
+
+    cases = {
+        "get_student_attendance (endpoint descriptor)": lambda: client.get_student_attendance(
+            "student-uuid", month="2024-01", limit=30
+        ),
+        "get_student_attendance (1.0.0 path)": lambda: baseline_get_student_attendance(
+            client, token_expiry, "student-uuid", month="2024-01", limit=30
+        ),
+        "get_current_student (endpoint descriptor)": lambda: client.get_current_student(),
+        "get_current_student (1.0.0 path)": lambda: baseline_request(
+            client, token_expiry, "GET", "/api/v1/students/me"
+        ),
+    }
+
+    for name, fn in cases.items():
+        fn()
+        best = min(timeit.repeat(fn, number=iterations, repeat=5))
+        print(f"{name:48s} {best / iterations * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
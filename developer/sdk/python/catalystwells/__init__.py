@@ -13,6 +13,23 @@ from .client import (
     Priority,
     create_client
 )
+from .token_store import (
+    TokenStore,
+    StoredToken,
+    MemoryTokenStore,
+    FileTokenStore,
+    SQLiteTokenStore
+)
+from .webhooks import (
+    WebhookReceiver,
+    WebhookEvent,
+    ChangePoller
+)
+from .hedging import HedgingPolicy, LatencyHistogram
+from .workers import (
+    SyncOrchestrator,
+    SyncResult
+)
 
 __version__ = "1.0.0"
 __all__ = [
@@ -24,5 +41,17 @@ __all__ = [
     "Environment",
     "NotificationType",
     "Priority",
-    "create_client"
+    "create_client",
+    "TokenStore",
+    "StoredToken",
+    "MemoryTokenStore",
+    "FileTokenStore",
+    "SQLiteTokenStore",
+    "WebhookReceiver",
+    "WebhookEvent",
+    "ChangePoller",
+    "SyncOrchestrator",
+    "SyncResult",
+    "HedgingPolicy",
+    "LatencyHistogram"
 ]
@@ -0,0 +1,165 @@
+"""
+CatalystWells Python SDK - Command Line Interface
+
+Usage:
+    catalystwells export --school SCHOOL_ID --class CLASS_ID --output ./export
+"""
+
+import argparse
+import os
+import sys
+from typing import Optional, List
+
+from .client import CatalystWells, CatalystWellsError, Environment
+from .export import DATASETS, SchoolExporter
+from .token_store import FileTokenStore
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="catalystwells", description="CatalystWells API tools")
+    parser.add_argument(
+        "--client-id",
+        default=os.environ.get("CATALYSTWELLS_CLIENT_ID"),
+        help="OAuth client ID (default: $CATALYSTWELLS_CLIENT_ID)"
+    )
+    parser.add_argument(
+        "--client-secret",
+        default=os.environ.get("CATALYSTWELLS_CLIENT_SECRET"),
+        help="OAuth client secret (default: $CATALYSTWELLS_CLIENT_SECRET)"
+    )
+    parser.add_argument(
+        "--environment",
+        choices=[e.value for e in Environment],
+        default=Environment.SANDBOX.value
+    )
+    parser.add_argument("--base-url", help="Override the API base URL")
+    credentials = parser.add_mutually_exclusive_group()
+    credentials.add_argument(
+        "--token-file",
+        default=os.environ.get("CATALYSTWELLS_TOKEN_FILE"),
+        help="Token file written by FileTokenStore (default: $CATALYSTWELLS_TOKEN_FILE)"
+    )
+    credentials.add_argument(
+        "--access-token",
+        default=os.environ.get("CATALYSTWELLS_ACCESS_TOKEN"),
+        help="Access token to use instead of a token file; not persisted "
+             "(default: $CATALYSTWELLS_ACCESS_TOKEN)"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export = subparsers.add_parser(
+        "export",
+        help="Export students, attendance, marks and homework for a school"
+    )
+    export.add_argument(
+        "--school",
+        help="School ID; only used to name the default output directory"
+    )
+    export.add_argument(
+        "--class",
+        dest="class_ids",
+        action="append",
+        default=[],
+        help="Export the students of this class (repeatable)"
+    )
+    export.add_argument(
+        "--students-file",
+        help="File with one student ID per line, in addition to --class"
+    )
+    export.add_argument(
+        "--output",
+        help="Output directory (default: ./export-<school> or ./export); re-run to resume"
+    )
+    export.add_argument("--format", choices=["ndjson", "parquet"], default="ndjson")
+    export.add_argument(
+        "--datasets",
+        default=",".join(DATASETS),
+        help=f"Comma-separated datasets to export (default: {','.join(DATASETS)})"
+    )
+    export.add_argument("--concurrency", type=int, default=8)
+    export.add_argument("--chunk-size", type=int, default=10000, help="Rows per part file")
+    export.add_argument("--start-date", help="Attendance start date (YYYY-MM-DD)")
+    export.add_argument("--end-date", help="Attendance end date (YYYY-MM-DD)")
+    export.add_argument("--academic-year", help="Academic year for marks")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if not args.client_id:
+        print("error: --client-id or $CATALYSTWELLS_CLIENT_ID is required", file=sys.stderr)
+        return 2
+
+    client = CatalystWells(
+        client_id=args.client_id,
+        client_secret=args.client_secret,
+        environment=Environment(args.environment),
+        base_url=args.base_url,
+        # A bare access token is never written to the token file
+        token_store=(
+            FileTokenStore(args.token_file)
+            if args.token_file and not args.access_token
+            else None
+        )
+    )
+    if args.access_token:
+        client.set_tokens({
+            "access_token": args.access_token,
+            "token_type": "Bearer",
+            "expires_in": 3600,
+            "scope": ""
+        })
+
+    with client:
+        try:
+            return _export(client, args)
+        except CatalystWellsError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+        except KeyboardInterrupt:
+            print("interrupted; re-run the same command to resume", file=sys.stderr)
+            return 130
+
+
+def _export(client: CatalystWells, args: argparse.Namespace) -> int:
+    if not args.class_ids and not args.students_file:
+        print("error: pass --class and/or --students-file to select students", file=sys.stderr)
+        return 2
+
+    attendance_params = {}
+    if args.start_date:
+        attendance_params["start_date"] = args.start_date
+    if args.end_date:
+        attendance_params["end_date"] = args.end_date
+    marks_params = {"academic_year": args.academic_year} if args.academic_year else {}
+
+    exporter = SchoolExporter(
+        client,
+        output_dir=args.output or (f"export-{args.school}" if args.school else "export"),
+        format=args.format,
+        datasets=[d.strip() for d in args.datasets.split(",") if d.strip()],
+        concurrency=args.concurrency,
+        chunk_size=args.chunk_size,
+        attendance_params=attendance_params,
+        marks_params=marks_params
+    )
+
+    student_ids = exporter.students_from_classes(args.class_ids)
+    if args.students_file:
+        seen = set(student_ids)
+        with open(args.students_file) as f:
+            for line in f:
+                student_id = line.strip()
+                if student_id and student_id not in seen:
+                    seen.add(student_id)
+                    student_ids.append(student_id)
+
+    stats = exporter.run(student_ids)
+    return 1 if stats.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
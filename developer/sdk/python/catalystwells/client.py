@@ -11,11 +11,17 @@ import httpx
 import hashlib
 import base64
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Union
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
+from . import endpoints
+from .endpoints import Endpoint
+from .hedging import Hedger, HedgingPolicy, LatencyHistogram
+from .token_store import TokenStore, StoredToken
+
 
 class Environment(Enum):
     SANDBOX = "sandbox"
@@ -86,6 +92,12 @@ class CatalystWells:
             client_secret="your_client_secret",
             environment=Environment.SANDBOX
         )
+    
+    Pass a ``token_store`` to persist tokens between processes; stored tokens
+    are loaded lazily on the first authenticated request.
+    
+    Pass a ``hedging`` policy to send backup requests for slow idempotent
+    GETs (see ``HedgingPolicy``).
     """
     
     def __init__(
@@ -94,7 +106,9 @@ class CatalystWells:
         client_secret: Optional[str] = None,
         redirect_uri: Optional[str] = None,
         environment: Environment = Environment.SANDBOX,
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        token_store: Optional[TokenStore] = None,
+        hedging: Optional[HedgingPolicy] = None
     ):
         self.client_id = client_id
         self.client_secret = client_secret
@@ -111,14 +125,33 @@ class CatalystWells:
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
+        self._token_store = token_store
+        self._tokens_loaded = token_store is None
+        self._refresh_after: Optional[float] = None
         self._http = httpx.Client(timeout=30.0)
+        self._hedger = Hedger(hedging) if hedging else None
+        
+        # Per-client request state, rebuilt when base_url, _http or the token changes
+        self._compiled_base_url: Optional[str] = None
+        self._compiled_http: Optional[httpx.Client] = None
+        self._url_templates: Dict[Endpoint, str] = {}
+        self._extensions: Dict[str, Any] = {}
+        self._auth_headers_token: Optional[str] = None
+        self._auth_headers: Optional[httpx.Headers] = None
     
     def __enter__(self):
         return self
     
     def __exit__(self, *args):
+        if self._hedger:
+            self._hedger.close()
         self._http.close()
     
+    @property
+    def latency_histograms(self) -> Dict[str, LatencyHistogram]:
+        """Per-endpoint latency histograms (only maintained when hedging is enabled)."""
+        return self._hedger.histograms if self._hedger else {}
+    
     # ==================== Authentication ====================
     
     def get_authorization_url(
@@ -217,10 +250,55 @@ class CatalystWells:
     def _set_tokens(self, tokens: TokenResponse) -> None:
         self._access_token = tokens.access_token
         self._refresh_token = tokens.refresh_token
-        self._token_expiry = datetime.now() + timedelta(seconds=tokens.expires_in)
+        self._set_token_expiry(datetime.now(timezone.utc) + timedelta(seconds=tokens.expires_in))
+        self._tokens_loaded = True
+        
+        if self._token_store:
+            self._token_store.save(StoredToken(
+                access_token=tokens.access_token,
+                expires_at=self._token_expiry.timestamp(),
+                token_type=tokens.token_type,
+                scope=tokens.scope,
+                refresh_token=tokens.refresh_token
+            ))
+    
+    def _load_stored_tokens(self) -> None:
+        """Load tokens from the token store, if one is configured."""
+        self._tokens_loaded = True
+        if not self._token_store:
+            return
+        
+        stored = self._token_store.load()
+        if stored:
+            self._access_token = stored.access_token
+            self._refresh_token = stored.refresh_token
+            self._set_token_expiry(datetime.fromtimestamp(stored.expires_at, tz=timezone.utc))
+    
+    def _set_token_expiry(self, expiry: Optional[datetime]) -> None:
+        self._token_expiry = expiry
+        # Auto-refresh 1 minute before expiry
+        self._refresh_after = expiry.timestamp() - 60 if expiry else None
+    
+    def _token_expiring(self) -> bool:
+        return self._refresh_after is not None and time.time() >= self._refresh_after
+    
+    def _refresh_expiring_token(self) -> None:
+        """Refresh the access token, coordinating with other processes via the store."""
+        if not self._token_store:
+            self.refresh_access_token()
+            return
+        
+        with self._token_store.refresh_lock():
+            # Another process may have refreshed while we waited for the lock
+            self._load_stored_tokens()
+            if self._token_expiring() and self._refresh_token:
+                self.refresh_access_token()
     
     def revoke_token(self, token: Optional[str] = None) -> None:
         """Revoke tokens."""
+        if not self._tokens_loaded:
+            self._load_stored_tokens()
+        
         self._request(
             "POST",
             "/api/oauth/revoke",
@@ -234,17 +312,19 @@ class CatalystWells:
         if not token or token == self._access_token:
             self._access_token = None
             self._refresh_token = None
-            self._token_expiry = None
+            self._set_token_expiry(None)
+            if self._token_store:
+                self._token_store.clear()
     
     # ==================== Students API ====================
     
     def get_current_student(self) -> Dict[str, Any]:
         """Get current authenticated student profile."""
-        return self._authenticated_request("GET", "/api/v1/students/me")
+        return self._call(endpoints.CURRENT_STUDENT)
     
     def get_student(self, student_id: str) -> Dict[str, Any]:
         """Get student by ID."""
-        return self._authenticated_request("GET", f"/api/v1/students/{student_id}")
+        return self._call(endpoints.STUDENT, student_id)
     
     def get_student_marks(
         self,
@@ -254,18 +334,12 @@ class CatalystWells:
         academic_year: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get student academic marks."""
-        params = {}
-        if term:
-            params["term"] = term
-        if subject:
-            params["subject"] = subject
-        if academic_year:
-            params["academic_year"] = academic_year
-        
-        return self._authenticated_request(
-            "GET",
-            f"/api/v1/students/{student_id}/marks",
-            params=params
+        return self._call(
+            endpoints.STUDENT_MARKS,
+            student_id,
+            term=term,
+            subject=subject,
+            academic_year=academic_year
         )
     
     # ==================== Attendance API ====================
@@ -279,20 +353,13 @@ class CatalystWells:
         limit: Optional[int] = None
     ) -> Dict[str, Any]:
         """Get student attendance records."""
-        params = {}
-        if start_date:
-            params["start_date"] = start_date
-        if end_date:
-            params["end_date"] = end_date
-        if month:
-            params["month"] = month
-        if limit:
-            params["limit"] = str(limit)
-        
-        return self._authenticated_request(
-            "GET",
-            f"/api/v1/attendance/student/{student_id}",
-            params=params
+        return self._call(
+            endpoints.STUDENT_ATTENDANCE,
+            student_id,
+            start_date=start_date,
+            end_date=end_date,
+            month=month,
+            limit=limit
         )
     
     # ==================== Timetable API ====================
@@ -303,12 +370,7 @@ class CatalystWells:
         day: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get student timetable."""
-        params = {"day": day} if day else {}
-        return self._authenticated_request(
-            "GET",
-            f"/api/v1/timetable/student/{student_id}",
-            params=params
-        )
+        return self._call(endpoints.STUDENT_TIMETABLE, student_id, day=day)
     
     # ==================== Wellbeing API ====================
     
@@ -318,17 +380,7 @@ class CatalystWells:
         aggregated: bool = False
     ) -> Dict[str, Any]:
         """Get current mood state."""
-        params = {}
-        if student_id:
-            params["student_id"] = student_id
-        if aggregated:
-            params["aggregated"] = "true"
-        
-        return self._authenticated_request(
-            "GET",
-            "/api/v1/wellbeing/mood/current",
-            params=params
-        )
+        return self._call(endpoints.CURRENT_MOOD, student_id=student_id, aggregated=aggregated)
     
     def get_mood_history(
         self,
@@ -337,11 +389,7 @@ class CatalystWells:
         limit: int = 50
     ) -> Dict[str, Any]:
         """Get mood history for a student."""
-        return self._authenticated_request(
-            "GET",
-            "/api/v1/wellbeing/mood/history",
-            params={"student_id": student_id, "days": str(days), "limit": str(limit)}
-        )
+        return self._call(endpoints.MOOD_HISTORY, student_id=student_id, days=days, limit=limit)
     
     def get_behavior_summary(
         self,
@@ -350,16 +398,11 @@ class CatalystWells:
         period: str = "month"
     ) -> Dict[str, Any]:
         """Get behavior summary."""
-        params = {"period": period}
-        if student_id:
-            params["student_id"] = student_id
-        if class_id:
-            params["class_id"] = class_id
-        
-        return self._authenticated_request(
-            "GET",
-            "/api/v1/wellbeing/behavior/summary",
-            params=params
+        return self._call(
+            endpoints.BEHAVIOR_SUMMARY,
+            period=period,
+            student_id=student_id,
+            class_id=class_id
         )
     
     # ==================== Schools API ====================
@@ -370,12 +413,7 @@ class CatalystWells:
         include: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Get school information."""
-        params = {"include": ",".join(include)} if include else {}
-        return self._authenticated_request(
-            "GET",
-            f"/api/v1/schools/{school_id}",
-            params=params
-        )
+        return self._call(endpoints.SCHOOL, school_id, include=include)
     
     # ==================== Classes API ====================
     
@@ -385,12 +423,7 @@ class CatalystWells:
         include: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Get class information."""
-        params = {"include": ",".join(include)} if include else {}
-        return self._authenticated_request(
-            "GET",
-            f"/api/v1/classes/{class_id}",
-            params=params
-        )
+        return self._call(endpoints.CLASS, class_id, include=include)
     
     # ==================== Assignments & Homework ====================
     
@@ -403,17 +436,14 @@ class CatalystWells:
         limit: int = 50
     ) -> Dict[str, Any]:
         """Get assignments."""
-        params = {"limit": str(limit)}
-        if student_id:
-            params["student_id"] = student_id
-        if class_id:
-            params["class_id"] = class_id
-        if subject_id:
-            params["subject_id"] = subject_id
-        if status:
-            params["status"] = status
-        
-        return self._authenticated_request("GET", "/api/v1/assignments", params=params)
+        return self._call(
+            endpoints.ASSIGNMENTS,
+            limit=limit,
+            student_id=student_id,
+            class_id=class_id,
+            subject_id=subject_id,
+            status=status
+        )
     
     def get_homework(
         self,
@@ -424,17 +454,14 @@ class CatalystWells:
         limit: int = 50
     ) -> Dict[str, Any]:
         """Get homework."""
-        params = {"limit": str(limit)}
-        if student_id:
-            params["student_id"] = student_id
-        if class_id:
-            params["class_id"] = class_id
-        if upcoming:
-            params["upcoming"] = "true"
-        if overdue:
-            params["overdue"] = "true"
-        
-        return self._authenticated_request("GET", "/api/v1/homework", params=params)
+        return self._call(
+            endpoints.HOMEWORK,
+            limit=limit,
+            student_id=student_id,
+            class_id=class_id,
+            upcoming=upcoming,
+            overdue=overdue
+        )
     
     # ==================== Notifications ====================
     
@@ -464,11 +491,7 @@ class CatalystWells:
         if data:
             payload["data"] = data
         
-        return self._authenticated_request(
-            "POST",
-            "/api/v1/notifications/send",
-            json=payload
-        )
+        return self._call(endpoints.SEND_NOTIFICATION, json=payload)
     
     def send_bulk_notifications(
         self,
@@ -479,9 +502,8 @@ class CatalystWells:
         priority: Priority = Priority.NORMAL
     ) -> Dict[str, Any]:
         """Send notifications to multiple users."""
-        return self._authenticated_request(
-            "PUT",
-            "/api/v1/notifications/send",
+        return self._call(
+            endpoints.SEND_BULK_NOTIFICATIONS,
             json={
                 "user_ids": user_ids,
                 "title": title,
@@ -502,17 +524,14 @@ class CatalystWells:
         limit: int = 50
     ) -> Dict[str, Any]:
         """Get announcements."""
-        params = {"limit": str(limit)}
-        if school_id:
-            params["school_id"] = school_id
-        if grade_id:
-            params["grade_id"] = grade_id
-        if class_id:
-            params["class_id"] = class_id
-        if category:
-            params["category"] = category
-        
-        return self._authenticated_request("GET", "/api/v1/announcements", params=params)
+        return self._call(
+            endpoints.ANNOUNCEMENTS,
+            limit=limit,
+            school_id=school_id,
+            grade_id=grade_id,
+            class_id=class_id,
+            category=category
+        )
     
     def create_announcement(
         self,
@@ -540,14 +559,13 @@ class CatalystWells:
         if expires_at:
             payload["expires_at"] = expires_at
         
-        return self._authenticated_request("POST", "/api/v1/announcements", json=payload)
+        return self._call(endpoints.CREATE_ANNOUNCEMENT, json=payload)
     
     # ==================== Privacy ====================
     
     def get_consent_status(self, user_id: Optional[str] = None) -> Dict[str, Any]:
         """Check consent status for a user."""
-        params = {"user_id": user_id} if user_id else {}
-        return self._authenticated_request("GET", "/api/v1/privacy/consent", params=params)
+        return self._call(endpoints.CONSENT_STATUS, user_id=user_id)
     
     def request_consent(
         self,
@@ -569,7 +587,7 @@ class CatalystWells:
         if expires_in_days:
             payload["expires_in_days"] = expires_in_days
         
-        return self._authenticated_request("POST", "/api/v1/privacy/consent", json=payload)
+        return self._call(endpoints.REQUEST_CONSENT, json=payload)
     
     # ==================== HTTP Helpers ====================
     
@@ -594,6 +612,10 @@ class CatalystWells:
             headers=headers
         )
         
+        return self._handle_response(response)
+    
+    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Decode a response body, raising CatalystWellsError on API errors."""
         result = response.json()
         
         if response.status_code >= 400:
@@ -612,18 +634,107 @@ class CatalystWells:
         **kwargs
     ) -> Dict[str, Any]:
         """Make authenticated HTTP request."""
+        headers = kwargs.pop("headers", {})
+        headers["Authorization"] = f"Bearer {self._ensure_access_token()}"
+        
+        return self._request(method, path, headers=headers, **kwargs)
+    
+    def _conditional_get(
+        self,
+        path: str,
+        params: Optional[Dict[str, str]] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[str]]:
+        """
+        Make an authenticated conditional GET.
+        
+        Returns ``(result, etag, last_modified)``; ``result`` is None when the
+        server answers 304 Not Modified.
+        """
+        headers = {"Authorization": f"Bearer {self._ensure_access_token()}"}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
+        response = self._http.request(
+            method="GET",
+            url=f"{self.base_url}{path}",
+            params=params,
+            headers=headers
+        )
+        
+        if response.status_code == 304:
+            return None, etag, last_modified
+        
+        result = self._handle_response(response)
+        return result, response.headers.get("ETag"), response.headers.get("Last-Modified")
+    
+    def _call(
+        self,
+        endpoint: Endpoint,
+        *path_args: str,
+        json: Optional[Dict[str, Any]] = None,
+        **params: Any
+    ) -> Dict[str, Any]:
+        """
+        Make an authenticated request to a declared endpoint.
+        
+        This is the fast path used by the API methods: the URL template,
+        merged headers and timeout are prepared once per client and the
+        request is sent without going through ``httpx.Client.build_request``.
+        """
+        if self._compiled_http is not self._http or self._compiled_base_url is not self.base_url:
+            self._compile()
+        
+        template = self._url_templates.get(endpoint)
+        if template is None:
+            template = self._url_templates[endpoint] = endpoint.url_template(self.base_url)
+        
+        token = self._ensure_access_token()
+        if token is not self._auth_headers_token:
+            headers = httpx.Headers(self._http.headers)
+            headers["Authorization"] = f"Bearer {token}"
+            self._auth_headers = headers
+            self._auth_headers_token = token
+        
+        request = httpx.Request(
+            endpoint.method,
+            template.format(*path_args) if path_args else template,
+            params=endpoint.encode_params(params) if endpoint.params else None,
+            json=json,
+            headers=self._auth_headers,
+            extensions=self._extensions
+        )
+        
+        if self._hedger and self._hedger.applies_to(endpoint):
+            response = self._hedger.send(self._http, endpoint, request)
+        else:
+            response = self._http.send(request)
+        return self._handle_response(response)
+    
+    def _compile(self) -> None:
+        self._url_templates = {}
+        self._extensions = {"timeout": self._http.timeout.as_dict()}
+        self._auth_headers_token = None
+        self._auth_headers = None
+        self._compiled_base_url = self.base_url
+        self._compiled_http = self._http
+    
+    def _ensure_access_token(self) -> str:
+        """Return the access token, loading or refreshing it if needed."""
+        if not self._tokens_loaded:
+            self._load_stored_tokens()
+        
         # Auto-refresh if token expires soon
-        if self._token_expiry and self._token_expiry < datetime.now() + timedelta(seconds=60):
-            if self._refresh_token:
-                self.refresh_access_token()
+        if self._token_expiring() and self._refresh_token:
+            self._refresh_expiring_token()
         
         if not self._access_token:
             raise CatalystWellsError("not_authenticated", "No access token available", 401)
         
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {self._access_token}"
-        
-        return self._request(method, path, headers=headers, **kwargs)
+        return self._access_token
 
 
 # Convenience function
@@ -631,12 +742,16 @@ def create_client(
     client_id: str,
     client_secret: Optional[str] = None,
     redirect_uri: Optional[str] = None,
-    environment: Environment = Environment.SANDBOX
+    environment: Environment = Environment.SANDBOX,
+    token_store: Optional[TokenStore] = None,
+    hedging: Optional[HedgingPolicy] = None
 ) -> CatalystWells:
     """Create a CatalystWells client instance."""
     return CatalystWells(
         client_id=client_id,
         client_secret=client_secret,
         redirect_uri=redirect_uri,
-        environment=environment
+        environment=environment,
+        token_store=token_store,
+        hedging=hedging
     )
@@ -0,0 +1,175 @@
+"""
+CatalystWells Python SDK - Endpoint Descriptors
+
+Each API endpoint is declared once with its method, path template and query
+parameter schema, so per-call work is limited to filling in values.
+"""
+
+import re
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+ParamEncoder = Callable[[Any], Optional[str]]
+
+
+def optional(value: Any) -> Optional[str]:
+    """Send the value as a string, omitting it when falsy."""
+    return str(value) if value else None
+
+
+def required(value: Any) -> Optional[str]:
+    """Always send the value as a string."""
+    return str(value)
+
+
+def flag(value: Any) -> Optional[str]:
+    """Send ``"true"`` when set, omitting the parameter otherwise."""
+    return "true" if value else None
+
+
+def csv(value: Optional[List[str]]) -> Optional[str]:
+    """Send a list as a comma-separated string, omitting it when empty."""
+    return ",".join(value) if value else None
+
+
+class Endpoint:
+    """
+    Descriptor for an API endpoint.
+
+    ``path`` may contain ``{name}`` placeholders, which are filled positionally
+    from the path arguments. ``params`` maps each accepted query parameter to
+    the encoder that turns its Python value into a query string value.
+    """
+
+    __slots__ = ("method", "path", "params", "idempotent", "path_params", "_template")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, ParamEncoder]] = None,
+        idempotent: Optional[bool] = None
+    ):
+        self.method = method
+        self.path = path
+        self.params: Tuple[Tuple[str, ParamEncoder], ...] = tuple((params or {}).items())
+        if idempotent is None:
+            idempotent = method in ("GET", "HEAD", "PUT", "DELETE")
+        self.idempotent = idempotent
+        self.path_params = tuple(re.findall(r"{(\w+)}", path))
+
+        counter = iter(range(len(self.path_params)))
+        self._template = re.sub(r"{\w+}", lambda _: "{%d}" % next(counter), path)
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.method} {self.path})"
+
+    def url_template(self, base_url: str) -> str:
+        """Return the full URL with positional ``{0}`` placeholders for path arguments."""
+        return base_url + self._template
+
+    def encode_params(self, values: Dict[str, Any]) -> Dict[str, str]:
+        """Encode query parameter values according to the schema."""
+        params = {}
+        for name, encode in self.params:
+            encoded = encode(values.pop(name, None))
+            if encoded is not None:
+                params[name] = encoded
+        if values:
+            raise TypeError(f"{self!r} got unexpected parameters: {', '.join(values)}")
+        return params
+
+
+# ==================== Students ====================
+
+CURRENT_STUDENT = Endpoint("GET", "/api/v1/students/me")
+STUDENT = Endpoint("GET", "/api/v1/students/{student_id}")
+STUDENT_MARKS = Endpoint(
+    "GET",
+    "/api/v1/students/{student_id}/marks",
+    {"term": optional, "subject": optional, "academic_year": optional}
+)
+
+# ==================== Attendance ====================
+
+STUDENT_ATTENDANCE = Endpoint(
+    "GET",
+    "/api/v1/attendance/student/{student_id}",
+    {"start_date": optional, "end_date": optional, "month": optional, "limit": optional}
+)
+
+# ==================== Timetable ====================
+
+STUDENT_TIMETABLE = Endpoint("GET", "/api/v1/timetable/student/{student_id}", {"day": optional})
+
+# ==================== Wellbeing ====================
+
+CURRENT_MOOD = Endpoint(
+    "GET",
+    "/api/v1/wellbeing/mood/current",
+    {"student_id": optional, "aggregated": flag}
+)
+MOOD_HISTORY = Endpoint(
+    "GET",
+    "/api/v1/wellbeing/mood/history",
+    {"student_id": required, "days": required, "limit": required}
+)
+BEHAVIOR_SUMMARY = Endpoint(
+    "GET",
+    "/api/v1/wellbeing/behavior/summary",
+    {"period": required, "student_id": optional, "class_id": optional}
+)
+
+# ==================== Schools & Classes ====================
+
+SCHOOL = Endpoint("GET", "/api/v1/schools/{school_id}", {"include": csv})
+CLASS = Endpoint("GET", "/api/v1/classes/{class_id}", {"include": csv})
+
+# ==================== Assignments & Homework ====================
+
+ASSIGNMENTS = Endpoint(
+    "GET",
+    "/api/v1/assignments",
+    {
+        "limit": required,
+        "student_id": optional,
+        "class_id": optional,
+        "subject_id": optional,
+        "status": optional
+    }
+)
+HOMEWORK = Endpoint(
+    "GET",
+    "/api/v1/homework",
+    {
+        "limit": required,
+        "student_id": optional,
+        "class_id": optional,
+        "upcoming": flag,
+        "overdue": flag
+    }
+)
+
+# ==================== Notifications ====================
+
+SEND_NOTIFICATION = Endpoint("POST", "/api/v1/notifications/send")
+SEND_BULK_NOTIFICATIONS = Endpoint("PUT", "/api/v1/notifications/send", idempotent=False)
+
+# ==================== Announcements ====================
+
+ANNOUNCEMENTS = Endpoint(
+    "GET",
+    "/api/v1/announcements",
+    {
+        "limit": required,
+        "school_id": optional,
+        "grade_id": optional,
+        "class_id": optional,
+        "category": optional
+    }
+)
+CREATE_ANNOUNCEMENT = Endpoint("POST", "/api/v1/announcements")
+
+# ==================== Privacy ====================
+
+CONSENT_STATUS = Endpoint("GET", "/api/v1/privacy/consent", {"user_id": optional})
+REQUEST_CONSENT = Endpoint("POST", "/api/v1/privacy/consent")
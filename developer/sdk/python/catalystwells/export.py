@@ -0,0 +1,346 @@
+"""
+CatalystWells Python SDK - Bulk Export
+
+Stream per-student data for a school into NDJSON or Parquet files with
+bounded memory, resuming from a checkpoint after interruption.
+
+Output layout:
+    <output_dir>/<dataset>/part-00000.<ext>
+    <output_dir>/checkpoint.json
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Callable, Iterable, Set, TextIO, Tuple
+
+import httpx
+
+from .client import CatalystWells, CatalystWellsError
+
+Row = Dict[str, Any]
+
+DATASETS = ("students", "attendance", "marks", "homework")
+
+# Parquet columns per dataset, following the API response fields. Every column
+# is a string (nested values as JSON) and fields not listed here go to "extra",
+# so all parts of a dataset share one schema.
+PARQUET_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "students": (
+        "id", "enrollment_number", "name", "grade", "section", "roll_number",
+        "avatar_url", "date_of_birth", "gender", "school"
+    ),
+    "attendance": (
+        "student_id", "date", "status", "check_in_time", "check_out_time",
+        "is_holiday", "notes"
+    ),
+    "marks": ("student_id", "subject", "exams", "average_percentage"),
+    "homework": (
+        "student_id", "id", "title", "description", "assigned_date", "due_date",
+        "estimated_time_minutes", "priority", "is_overdue", "is_completed",
+        "completed_at", "days_until_due", "subject", "class", "teacher"
+    )
+}
+
+
+@dataclass
+class ExportStats:
+    rows: Dict[str, int] = field(default_factory=lambda: {d: 0 for d in DATASETS})
+    students: int = 0
+    errors: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.rows.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.total_rows / elapsed if elapsed > 0 else 0.0
+
+
+class SchoolExporter:
+    """
+    Export students, attendance, marks and homework for a set of students.
+
+    Requests for different students run concurrently on ``concurrency``
+    threads. Rows are buffered per dataset and written out as a new part file
+    every ``chunk_size`` rows; a student counts as exported for a dataset only
+    once its rows are in a written part, so re-running with the same
+    ``output_dir`` skips finished work and retries the rest.
+
+    Attendance is paged newest-first ``page_size`` records at a time. The
+    homework endpoint cannot be paged, so a response that fills
+    ``homework_limit`` is treated as an error rather than exported truncated.
+    The API returns at most 1000 rows per request, however large the
+    ``limit``, so neither setting should be raised above 1000: a larger
+    value would let a capped response pass as complete.
+    """
+
+    def __init__(
+        self,
+        client: CatalystWells,
+        output_dir: str,
+        format: str = "ndjson",
+        datasets: Iterable[str] = DATASETS,
+        concurrency: int = 8,
+        chunk_size: int = 10000,
+        page_size: int = 1000,
+        homework_limit: int = 1000,
+        attendance_params: Optional[Dict[str, Any]] = None,
+        marks_params: Optional[Dict[str, Any]] = None,
+        log: Optional[TextIO] = None
+    ):
+        if format not in ("ndjson", "parquet"):
+            raise ValueError(f"Unsupported export format: {format}")
+        unknown = set(datasets) - set(DATASETS)
+        if unknown:
+            raise ValueError(f"Unknown datasets: {', '.join(sorted(unknown))}")
+
+        self.client = client
+        self.output_dir = output_dir
+        self.format = format
+        self.datasets = tuple(datasets)
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.page_size = page_size
+        self.homework_limit = homework_limit
+        self.attendance_params = attendance_params or {}
+        self.marks_params = marks_params or {}
+        self.log = log or sys.stderr
+        self.stats = ExportStats()
+
+        self._lock = threading.Lock()
+        self._checkpoint_path = os.path.join(output_dir, "checkpoint.json")
+        self._checkpoint = _Checkpoint.load(self._checkpoint_path)
+        self._buffers: Dict[str, List[Row]] = {d: [] for d in self.datasets}
+        self._pending: Dict[str, Set[str]] = {d: set() for d in self.datasets}
+
+    # ==================== Student discovery ====================
+
+    def students_from_classes(self, class_ids: Iterable[str]) -> List[str]:
+        """Collect the IDs of active students enrolled in the given classes."""
+        student_ids: List[str] = []
+        seen: Set[str] = set()
+        for class_id in class_ids:
+            result = self.client.get_class(class_id, include=["students"])
+            for student in result.get("students", []):
+                student_id = student.get("id")
+                if student_id and student_id not in seen:
+                    seen.add(student_id)
+                    student_ids.append(student_id)
+        return student_ids
+
+    # ==================== Export ====================
+
+    def run(self, student_ids: Iterable[str]) -> ExportStats:
+        """Export every dataset for the given students."""
+        for dataset in self.datasets:
+            os.makedirs(os.path.join(self.output_dir, dataset), exist_ok=True)
+        self._remove_orphan_parts()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            in_flight: Set["Future[None]"] = set()
+            for student_id in student_ids:
+                datasets = [d for d in self.datasets if not self._checkpoint.is_done(d, student_id)]
+                if not datasets:
+                    continue
+                if len(in_flight) >= self.concurrency * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                in_flight.add(pool.submit(self._export_student, student_id, datasets))
+            for future in in_flight:
+                future.result()
+
+        with self._lock:
+            for dataset in self.datasets:
+                self._flush(dataset)
+        self._report(final=True)
+        return self.stats
+
+    def _export_student(self, student_id: str, datasets: List[str]) -> None:
+        results: List[Tuple[str, List[Row]]] = []
+        for dataset in datasets:
+            try:
+                rows = self._fetch(dataset, student_id)
+            except (CatalystWellsError, httpx.HTTPError, ValueError) as e:
+                with self._lock:
+                    self.stats.errors += 1
+                self.log.write(f"error: {dataset} for student {student_id}: {e}\n")
+                continue
+            results.append((dataset, rows))
+
+        with self._lock:
+            self.stats.students += 1
+            for dataset, rows in results:
+                self._buffers[dataset].extend(rows)
+                self._pending[dataset].add(student_id)
+                self.stats.rows[dataset] += len(rows)
+                if len(self._buffers[dataset]) >= self.chunk_size:
+                    self._flush(dataset)
+
+    def _fetch(self, dataset: str, student_id: str) -> List[Row]:
+        if dataset == "students":
+            return [self.client.get_student(student_id)]
+        if dataset == "attendance":
+            return [{"student_id": student_id, **r} for r in self._fetch_attendance(student_id)]
+        if dataset == "marks":
+            result = self.client.get_student_marks(student_id, **self.marks_params)
+            return [{"student_id": student_id, **r} for r in result.get("subjects", [])]
+
+        result = self.client.get_homework(student_id=student_id, limit=self.homework_limit)
+        homework = result.get("homework", [])
+        if len(homework) >= self.homework_limit:
+            raise ValueError(
+                f"homework response hit the limit of {self.homework_limit} records; "
+                "it cannot be exported completely"
+            )
+        return [{"student_id": student_id, **r} for r in homework]
+
+    def _fetch_attendance(self, student_id: str) -> List[Row]:
+        """Page through attendance, newest first, moving ``end_date`` back each page."""
+        params = dict(self.attendance_params)
+        params.pop("limit", None)
+        records: List[Row] = []
+        while True:
+            result = self.client.get_student_attendance(
+                student_id, limit=self.page_size, **params
+            )
+            page = result.get("records", [])
+            records.extend(page)
+            if len(page) < self.page_size:
+                return records
+
+            oldest = page[-1]["date"]
+            if sum(1 for r in page if r["date"] == oldest) > 1:
+                # The next page would start before this date and skip its other records
+                raise ValueError(
+                    f"attendance page ends inside {oldest}, which has several records; "
+                    "increase page_size"
+                )
+            params["end_date"] = (date.fromisoformat(oldest) - timedelta(days=1)).isoformat()
+
+    def _flush(self, dataset: str) -> None:
+        """Write buffered rows as a new part file and checkpoint. Caller holds the lock."""
+        rows = self._buffers[dataset]
+        if rows:
+            part = self._checkpoint.next_part.get(dataset, 0)
+            path = os.path.join(self.output_dir, dataset, f"part-{part:05d}.{self.format}")
+            _WRITERS[self.format](path, dataset, rows)
+            self._checkpoint.next_part[dataset] = part + 1
+
+        self._checkpoint.mark_done(dataset, self._pending[dataset])
+        self._checkpoint.save(self._checkpoint_path)
+        self._buffers[dataset] = []
+        self._pending[dataset] = set()
+        self._report()
+
+    def _remove_orphan_parts(self) -> None:
+        """Delete part files written after the last checkpoint (e.g. before a crash)."""
+        for dataset in self.datasets:
+            next_part = self._checkpoint.next_part.get(dataset, 0)
+            directory = os.path.join(self.output_dir, dataset)
+            for name in os.listdir(directory):
+                if name.startswith("part-") and int(name[5:10]) >= next_part:
+                    os.unlink(os.path.join(directory, name))
+
+    def _report(self, final: bool = False) -> None:
+        stats = self.stats
+        prefix = "done" if final else "progress"
+        counts = " ".join(f"{d}={stats.rows[d]}" for d in self.datasets)
+        self.log.write(
+            f"{prefix}: {stats.students} students, {stats.total_rows} rows "
+            f"({counts}), {stats.rows_per_second:.1f} rows/s, {stats.errors} errors\n"
+        )
+        self.log.flush()
+
+
+# ==================== Checkpoint ====================
+
+@dataclass
+class _Checkpoint:
+    done: Dict[str, Set[str]] = field(default_factory=dict)
+    next_part: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> "_Checkpoint":
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls()
+        return cls(
+            done={d: set(ids) for d, ids in data.get("done", {}).items()},
+            next_part=data.get("next_part", {})
+        )
+
+    def save(self, path: str) -> None:
+        data = {
+            "done": {d: sorted(ids) for d, ids in self.done.items()},
+            "next_part": self.next_part
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def is_done(self, dataset: str, student_id: str) -> bool:
+        return student_id in self.done.get(dataset, ())
+
+    def mark_done(self, dataset: str, student_ids: Set[str]) -> None:
+        self.done.setdefault(dataset, set()).update(student_ids)
+
+
+# ==================== Writers ====================
+
+def _write_ndjson(path: str, dataset: str, rows: List[Row]) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, separators=(",", ":"), default=str))
+            f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def _write_parquet(path: str, dataset: str, rows: List[Row]) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export requires the 'pyarrow' package. "
+            "Install it with: pip install catalystwells[parquet]"
+        ) from e
+
+    names = PARQUET_COLUMNS[dataset]
+    known = set(names)
+    columns: Dict[str, List[Optional[str]]] = {name: [] for name in names + ("extra",)}
+    for row in rows:
+        for name in names:
+            columns[name].append(_to_string(row.get(name)))
+        extra = {k: v for k, v in row.items() if k not in known}
+        columns["extra"].append(json.dumps(extra, default=str) if extra else None)
+
+    schema = pa.schema([(name, pa.string()) for name in columns])
+    tmp_path = path + ".tmp"
+    pq.write_table(pa.Table.from_pydict(columns, schema=schema), tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
+
+
+_WRITERS: Dict[str, Callable[[str, str, List[Row]], None]] = {
+    "ndjson": _write_ndjson,
+    "parquet": _write_parquet
+}
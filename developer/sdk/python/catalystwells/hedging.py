@@ -0,0 +1,210 @@
+"""
+CatalystWells Python SDK - Hedged Requests
+
+Cut tail latency on idempotent reads by sending a backup request when the
+first one is slower than usual for that endpoint.
+"""
+
+import bisect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Optional, List, Dict, FrozenSet
+
+import httpx
+
+from .endpoints import Endpoint
+
+# Bucket upper bounds in seconds: 1ms to ~2min, 25% apart
+_BUCKETS = tuple(0.001 * 1.25 ** i for i in range(53))
+
+
+@dataclass
+class HedgingPolicy:
+    """
+    Settings for hedged requests.
+
+    A backup request is sent once the first has been outstanding longer than
+    the endpoint's observed ``percentile`` latency (but at least
+    ``min_delay`` seconds). Hedging starts after ``min_samples`` requests
+    to the endpoint, and backups are capped at ``budget`` times the number
+    of hedge-eligible requests (0.05 = at most 5% extra load).
+
+    ``endpoints`` limits hedging to these paths (as declared in
+    ``catalystwells.endpoints``, e.g. ``"/api/v1/wellbeing/behavior/summary"``);
+    by default every idempotent GET is eligible.
+
+    ``max_workers`` caps the requests in flight on the hedging pool; callers
+    beyond that are sent directly on their own thread without a backup.
+    """
+    percentile: float = 0.95
+    budget: float = 0.05
+    min_samples: int = 20
+    min_delay: float = 0.01
+    max_workers: int = 32
+    endpoints: Optional[FrozenSet[str]] = None
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with periodic decay."""
+
+    def __init__(self, max_samples: int = 10000):
+        self.max_samples = max_samples
+        self._counts = [0] * (len(_BUCKETS) + 1)
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return self._total
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._counts[bisect.bisect_left(_BUCKETS, seconds)] += 1
+            self._total += 1
+            if self._total >= self.max_samples:
+                # Halve the counts so the histogram follows recent latency
+                self._counts = [c // 2 for c in self._counts]
+                self._total = sum(self._counts)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Return the upper bound of the bucket holding the ``p`` quantile."""
+        with self._lock:
+            if not self._total:
+                return None
+            threshold = p * self._total
+            seen = 0
+            for i, count in enumerate(self._counts):
+                seen += count
+                if seen >= threshold:
+                    return _BUCKETS[i] if i < len(_BUCKETS) else _BUCKETS[-1]
+            return _BUCKETS[-1]
+
+
+class Hedger:
+    """
+    Send requests with hedging according to a ``HedgingPolicy``.
+
+    A hedged request runs on a pool thread so the caller can return as soon
+    as either attempt answers. Pool slots are never queued for: when no slot
+    is free the request is sent on the caller's thread without a backup, and
+    the hedge delay is measured from the moment the first attempt starts.
+    """
+
+    def __init__(self, policy: HedgingPolicy):
+        self.policy = policy
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.requests = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(policy.max_workers)
+        self._pool = ThreadPoolExecutor(
+            max_workers=policy.max_workers,
+            thread_name_prefix="catalystwells-hedge"
+        )
+
+    def applies_to(self, endpoint: Endpoint) -> bool:
+        if endpoint.method != "GET" or not endpoint.idempotent:
+            return False
+        return self.policy.endpoints is None or endpoint.path in self.policy.endpoints
+
+    def send(
+        self,
+        http: httpx.Client,
+        endpoint: Endpoint,
+        request: httpx.Request
+    ) -> httpx.Response:
+        histogram = self.histograms.get(endpoint.path)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(endpoint.path, LatencyHistogram())
+
+        with self._lock:
+            self.requests += 1
+
+        delay = None
+        if histogram.count >= self.policy.min_samples:
+            delay = histogram.percentile(self.policy.percentile)
+        if delay is None or not self._slots.acquire(blocking=False):
+            return self._timed_send(http, request, histogram)
+
+        started = threading.Event()
+        primary = self._pool.submit(self._slot_send, started, http, request, histogram)
+        started.wait()
+        done, _ = wait([primary], timeout=max(delay, self.policy.min_delay))
+        if done or not self._slots.acquire(blocking=False):
+            return primary.result()
+        if not self._take_budget():
+            self._slots.release()
+            return primary.result()
+
+        backup = self._pool.submit(
+            self._slot_send, threading.Event(), http, _copy_request(request), histogram
+        )
+        return _first_success([primary, backup])
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.policy.budget * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def _slot_send(
+        self,
+        started: threading.Event,
+        http: httpx.Client,
+        request: httpx.Request,
+        histogram: LatencyHistogram
+    ) -> httpx.Response:
+        started.set()
+        try:
+            return self._timed_send(http, request, histogram)
+        finally:
+            self._slots.release()
+
+    @staticmethod
+    def _timed_send(
+        http: httpx.Client,
+        request: httpx.Request,
+        histogram: LatencyHistogram
+    ) -> httpx.Response:
+        start = time.monotonic()
+        response = http.send(request)
+        histogram.record(time.monotonic() - start)
+        return response
+
+
+def _copy_request(request: httpx.Request) -> httpx.Request:
+    """Build an independent copy of a bodiless request for the backup attempt."""
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=request.headers,
+        extensions=dict(request.extensions)
+    )
+
+
+def _first_success(futures: List["Future[httpx.Response]"]) -> httpx.Response:
+    """
+    Return the first successful result, cancelling the other request.
+
+    A request that is already on the wire cannot be interrupted with the
+    synchronous client; its response is discarded when it arrives.
+    """
+    pending = set(futures)
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                for other in pending:
+                    other.cancel()
+                return future.result()
+            error = error or future.exception()
+    assert error is not None
+    raise error
@@ -0,0 +1,297 @@
+"""
+CatalystWells Python SDK - Token Stores
+
+Persistent storage for OAuth tokens so that short-lived processes can reuse
+an existing access token instead of repeating the token exchange.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, Iterator, Union
+
+
+@dataclass
+class StoredToken:
+    """Token set as persisted by a token store.
+
+    ``expires_at`` is a UTC epoch timestamp so it stays meaningful across
+    processes and hosts.
+    """
+    access_token: str
+    expires_at: float
+    token_type: str = "Bearer"
+    scope: str = ""
+    refresh_token: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StoredToken":
+        return cls(
+            access_token=data["access_token"],
+            expires_at=float(data["expires_at"]),
+            token_type=data.get("token_type", "Bearer"),
+            scope=data.get("scope", ""),
+            refresh_token=data.get("refresh_token")
+        )
+
+
+class TokenStore(ABC):
+    """
+    Base class for token stores.
+
+    Subclasses must implement ``load``, ``save`` and ``clear``, and may override
+    ``refresh_lock`` to serialise token refreshes across processes.
+
+    If ``encryption_key`` is given (a Fernet key), tokens are encrypted at
+    rest. This requires the ``cryptography`` package
+    (``pip install catalystwells[crypto]``).
+    """
+
+    def __init__(self, encryption_key: Optional[Union[str, bytes]] = None):
+        self._fernet = _make_fernet(encryption_key) if encryption_key else None
+
+    @abstractmethod
+    def load(self) -> Optional[StoredToken]:
+        """Return the stored token, or None if nothing is stored."""
+
+    @abstractmethod
+    def save(self, token: StoredToken) -> None:
+        """Persist a token, replacing any previous one."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove any stored token."""
+
+    @contextmanager
+    def refresh_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock while refreshing the token."""
+        yield
+
+    def _encode(self, token: StoredToken) -> bytes:
+        payload = json.dumps(token.to_dict()).encode()
+        if self._fernet:
+            payload = self._fernet.encrypt(payload)
+        return payload
+
+    def _decode(self, payload: bytes) -> Optional[StoredToken]:
+        if self._fernet:
+            from cryptography.fernet import InvalidToken
+
+            try:
+                payload = self._fernet.decrypt(payload)
+            except InvalidToken:
+                return None
+        try:
+            return StoredToken.from_dict(json.loads(payload))
+        except (ValueError, KeyError, TypeError):
+            return None
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store shared between clients in the same process."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._token: Optional[StoredToken] = None
+        self._lock = threading.Lock()
+        self._refresh = threading.Lock()
+
+    def load(self) -> Optional[StoredToken]:
+        with self._lock:
+            return self._token
+
+    def save(self, token: StoredToken) -> None:
+        with self._lock:
+            self._token = token
+
+    def clear(self) -> None:
+        with self._lock:
+            self._token = None
+
+    @contextmanager
+    def refresh_lock(self) -> Iterator[None]:
+        with self._refresh:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """
+    Token store backed by a file on disk.
+
+    Writes are atomic (write to a temporary file, then rename) and refreshes
+    are serialised across processes with an advisory lock on ``<path>.lock``.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        encryption_key: Optional[Union[str, bytes]] = None
+    ):
+        super().__init__(encryption_key)
+        self.path = os.fspath(path)
+        self._thread_lock = threading.Lock()
+
+    def load(self) -> Optional[StoredToken]:
+        try:
+            with open(self.path, "rb") as f:
+                return self._decode(f.read())
+        except FileNotFoundError:
+            return None
+
+    def save(self, token: StoredToken) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".catalystwells-token-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._encode(token))
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def clear(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def refresh_lock(self) -> Iterator[None]:
+        with self._thread_lock, _file_lock(self.path + ".lock"):
+            yield
+
+
+class SQLiteTokenStore(TokenStore):
+    """
+    Token store backed by a SQLite database.
+
+    Several clients can share one database by using different ``key`` values.
+    Refreshes are serialised across processes with an advisory lock on
+    ``<path>.<key>.lock``.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        key: str = "default",
+        encryption_key: Optional[Union[str, bytes]] = None
+    ):
+        super().__init__(encryption_key)
+        self.path = os.fspath(path)
+        self.key = key
+        self._thread_lock = threading.Lock()
+        # Tokens may be stored unencrypted, so keep the database private like
+        # FileTokenStore does, before SQLite creates it with the umask
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(self.path, 0o600)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS catalystwells_tokens "
+                    "(key TEXT PRIMARY KEY, payload BLOB NOT NULL)"
+                )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30.0)
+
+    def load(self) -> Optional[StoredToken]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT payload FROM catalystwells_tokens WHERE key = ?", (self.key,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return self._decode(bytes(row[0])) if row else None
+
+    def save(self, token: StoredToken) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO catalystwells_tokens (key, payload) VALUES (?, ?)",
+                    (self.key, self._encode(token))
+                )
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM catalystwells_tokens WHERE key = ?", (self.key,))
+        finally:
+            conn.close()
+
+    @contextmanager
+    def refresh_lock(self) -> Iterator[None]:
+        with self._thread_lock, _file_lock(f"{self.path}.{self.key}.lock"):
+            yield
+
+
+# ==================== Helpers ====================
+
+def _make_fernet(key: Union[str, bytes]) -> Any:
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError as e:
+        raise ImportError(
+            "Token encryption requires the 'cryptography' package. "
+            "Install it with: pip install catalystwells[crypto]"
+        ) from e
+    return Fernet(key.encode() if isinstance(key, str) else key)
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        _lock_file(fd)
+        try:
+            yield
+        finally:
+            _unlock_file(fd)
+    finally:
+        os.close(fd)
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
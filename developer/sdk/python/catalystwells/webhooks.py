@@ -0,0 +1,388 @@
+"""
+CatalystWells Python SDK - Webhooks
+
+Receive signed webhook deliveries instead of polling the API for changes.
+
+Usage:
+    receiver = WebhookReceiver(signing_secret="whsec_...")
+
+    @receiver.on("wellness.alert")
+    async def handle_alert(event: WebhookEvent) -> None:
+        ...
+
+    # Mount ``receiver`` in any ASGI server, e.g. ``uvicorn app:receiver``
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Callable, Awaitable, Union
+
+import httpx
+
+from . import endpoints
+from .client import CatalystWells, CatalystWellsError
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "x-catalystwells-signature"
+TIMESTAMP_HEADER = "x-catalystwells-timestamp"
+
+WebhookHandler = Callable[["WebhookEvent"], Awaitable[None]]
+
+
+@dataclass
+class WebhookEvent:
+    id: str
+    event: str
+    created_at: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "WebhookEvent":
+        return cls(
+            id=str(payload["id"]),
+            event=payload["event"],
+            created_at=payload.get("created_at"),
+            data=payload.get("data") or {}
+        )
+
+
+def compute_signature(payload: Union[str, bytes], secret: str) -> str:
+    """Compute the hex HMAC-SHA256 signature of a webhook payload."""
+    if isinstance(payload, str):
+        payload = payload.encode()
+    return hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+
+
+def verify_signature(
+    payload: Union[str, bytes],
+    signature: str,
+    secret: str,
+    timestamp: Optional[str] = None,
+    tolerance: Optional[int] = 300
+) -> bool:
+    """
+    Verify a webhook signature.
+
+    If ``timestamp`` and ``tolerance`` are given, deliveries older (or newer)
+    than ``tolerance`` seconds are rejected as well.
+    """
+    if timestamp is not None and tolerance is not None:
+        try:
+            if abs(time.time() - int(timestamp)) > tolerance:
+                return False
+        except ValueError:
+            return False
+    return hmac.compare_digest(compute_signature(payload, secret), signature)
+
+
+class WebhookReceiver:
+    """
+    ASGI application that verifies, deduplicates and dispatches webhooks.
+
+    Verified deliveries are acknowledged with ``202`` and queued; ``workers``
+    tasks dispatch them to the registered handlers. When the queue is full the
+    receiver answers ``503`` so the platform retries the delivery later.
+    Deliveries whose event ID was already accepted are acknowledged and
+    dropped. Because a delivery is acknowledged before it is handled, the
+    platform does not retry an event whose handler fails: the failure is
+    logged and the event is dropped. Its ID is forgotten, so a manual
+    redelivery of the same event is processed again.
+    """
+
+    def __init__(
+        self,
+        signing_secret: str,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        dedupe_size: int = 10000,
+        tolerance: Optional[int] = 300
+    ):
+        self.signing_secret = signing_secret
+        self.workers = workers
+        self.tolerance = tolerance
+        self._max_queue_size = max_queue_size
+        self._dedupe_size = dedupe_size
+        self._handlers: Dict[str, List[WebhookHandler]] = {}
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._queue: Optional["asyncio.Queue[WebhookEvent]"] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    # ==================== Handlers ====================
+
+    def on(self, event_type: str) -> Callable[[WebhookHandler], WebhookHandler]:
+        """Register an async handler for an event type (``"*"`` matches all)."""
+        def decorator(handler: WebhookHandler) -> WebhookHandler:
+            self.add_handler(event_type, handler)
+            return handler
+        return decorator
+
+    def add_handler(self, event_type: str, handler: WebhookHandler) -> None:
+        """Register an async handler for an event type (``"*"`` matches all)."""
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    # ==================== Queue ====================
+
+    async def start(self) -> None:
+        """Start the dispatch workers."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Wait for queued events to be handled, then stop the workers."""
+        if not self._tasks or self._queue is None:
+            return
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, event: WebhookEvent, wait: bool = True) -> bool:
+        """
+        Queue an event for dispatch.
+
+        Returns False if the event ID was already accepted. With
+        ``wait=False``, raises ``asyncio.QueueFull`` instead of waiting for
+        space in the queue.
+        """
+        await self.start()
+        assert self._queue is not None
+        if event.id in self._seen:
+            return False
+        self._remember(event.id)
+        try:
+            if wait:
+                await self._queue.put(event)
+            else:
+                self._queue.put_nowait(event)
+        except BaseException:
+            self._seen.pop(event.id, None)
+            raise
+        return True
+
+    def _remember(self, event_id: str) -> None:
+        self._seen[event_id] = None
+        if len(self._seen) > self._dedupe_size:
+            self._seen.popitem(last=False)
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            event = await self._queue.get()
+            try:
+                await self.dispatch(event)
+            except Exception:
+                logger.exception("Webhook handler failed for event %s (%s)", event.id, event.event)
+                self._seen.pop(event.id, None)
+            finally:
+                self._queue.task_done()
+
+    async def dispatch(self, event: WebhookEvent) -> None:
+        """Run all handlers registered for an event, bypassing the queue."""
+        handlers = self._handlers.get(event.event, []) + self._handlers.get("*", [])
+        for handler in handlers:
+            await handler(event)
+
+    # ==================== ASGI ====================
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        send: Callable[[Dict[str, Any]], Awaitable[None]]
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            await _respond(send, 405, {"error": "method_not_allowed"})
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        signature = headers.get(SIGNATURE_HEADER)
+        if not signature or not verify_signature(
+            body,
+            signature,
+            self.signing_secret,
+            timestamp=headers.get(TIMESTAMP_HEADER),
+            tolerance=self.tolerance
+        ):
+            await _respond(send, 401, {"error": "invalid_signature"})
+            return
+
+        try:
+            event = WebhookEvent.from_payload(json.loads(body))
+        except (ValueError, KeyError, TypeError):
+            await _respond(send, 400, {"error": "invalid_payload"})
+            return
+
+        try:
+            accepted = await self.submit(event, wait=False)
+        except asyncio.QueueFull:
+            await _respond(send, 503, {"error": "queue_full"})
+            return
+
+        await _respond(send, 202, {"received": True, "duplicate": not accepted})
+
+    async def _lifespan(
+        self,
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        send: Callable[[Dict[str, Any]], Awaitable[None]]
+    ) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+class ChangePoller:
+    """
+    Polling fallback that emits events only when a resource changes.
+
+    Each watched resource is fetched with conditional requests
+    (``If-None-Match`` / ``If-Modified-Since``), so an unchanged resource
+    costs a bodiless 304. If the server sends no validators, a digest of the
+    body is compared instead. Changes are submitted to a ``WebhookReceiver``
+    as synthetic events, so the same handlers serve both delivery paths.
+
+    A watch whose request fails is logged and left unchanged, so its next
+    successful poll still reports the change.
+    """
+
+    def __init__(self, client: CatalystWells, interval: float = 60.0):
+        self.client = client
+        self.interval = interval
+        self._watches: List[_Watch] = []
+        # Keeps event IDs unique across pollers feeding the same receiver
+        self._poller_id = secrets.token_hex(8)
+
+    def watch(
+        self,
+        event_type: str,
+        path: str,
+        params: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Watch a GET endpoint and emit ``event_type`` when it changes."""
+        self._watches.append(_Watch(event_type, path, params or {}))
+
+    def watch_mood(
+        self,
+        student_id: Optional[str] = None,
+        aggregated: bool = False
+    ) -> None:
+        """Watch the current mood (see ``CatalystWells.get_current_mood``)."""
+        endpoint = endpoints.CURRENT_MOOD
+        params = endpoint.encode_params({"student_id": student_id, "aggregated": aggregated})
+        self.watch("wellbeing.mood.changed", endpoint.path, params)
+
+    def watch_announcements(
+        self,
+        school_id: Optional[str] = None,
+        class_id: Optional[str] = None,
+        limit: int = 50
+    ) -> None:
+        """Watch announcements (see ``CatalystWells.get_announcements``)."""
+        endpoint = endpoints.ANNOUNCEMENTS
+        params = endpoint.encode_params(
+            {"limit": limit, "school_id": school_id, "class_id": class_id}
+        )
+        self.watch("announcements.changed", endpoint.path, params)
+
+    def poll_once(self) -> List[WebhookEvent]:
+        """Fetch every watched resource once and return events for those that changed."""
+        events = []
+        for index, w in enumerate(self._watches):
+            try:
+                result, etag, last_modified = self.client._conditional_get(
+                    w.path, w.params, etag=w.etag, last_modified=w.last_modified
+                )
+            except (CatalystWellsError, httpx.HTTPError) as e:
+                logger.warning("Polling %s %s failed: %s", w.path, w.params, e)
+                continue
+            w.etag, w.last_modified = etag, last_modified
+            if result is None:
+                continue
+
+            digest = hashlib.sha256(
+                json.dumps(result, sort_keys=True, default=str).encode()
+            ).hexdigest()
+            if digest == w.digest:
+                continue
+
+            first = w.digest is None
+            w.digest = digest
+            w.changes += 1
+            if not first:
+                events.append(WebhookEvent(
+                    id=f"poll:{self._poller_id}:{index}:{w.event_type}:{w.changes}",
+                    event=w.event_type,
+                    created_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    data={"path": w.path, "params": w.params, "result": result}
+                ))
+        return events
+
+    async def run(self, receiver: WebhookReceiver) -> None:
+        """Poll forever, submitting change events to ``receiver``."""
+        while True:
+            try:
+                events = await asyncio.to_thread(self.poll_once)
+                for event in events:
+                    await receiver.submit(event)
+            except Exception:
+                logger.exception("Change poll failed; retrying in %s seconds", self.interval)
+            await asyncio.sleep(self.interval)
+
+
+# ==================== Helpers ====================
+
+@dataclass
+class _Watch:
+    event_type: str
+    path: str
+    params: Dict[str, str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    digest: Optional[str] = None
+    changes: int = 0
+
+
+async def _respond(
+    send: Callable[[Dict[str, Any]], Awaitable[None]],
+    status: int,
+    body: Dict[str, Any]
+) -> None:
+    payload = json.dumps(body).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(payload)).encode())
+        ]
+    })
+    await send({"type": "http.response.body", "body": payload})
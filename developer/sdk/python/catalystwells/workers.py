@@ -0,0 +1,290 @@
+"""
+CatalystWells Python SDK - Multi-process Sync Workers
+
+Spread CPU-bound per-student work (JSON decoding, transformation) across
+processes while sharing a single OAuth token.
+
+Usage:
+    def transform(client: CatalystWells, student_id: str) -> Dict[str, Any]:
+        student = client.get_student(student_id)
+        return {"id": student["id"], "name": student["name"]}
+
+    orchestrator = SyncOrchestrator(
+        transform,
+        client_kwargs={"client_id": "...", "client_secret": "..."},
+        token_path="/var/lib/sync/token.json",
+        processes=8
+    )
+    for result in orchestrator.run(student_ids):
+        loader.write(result.data)  # raw bytes, no decoding in the parent
+"""
+
+import json
+import mmap
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple, Union
+
+from .client import CatalystWells, TokenResponse
+from .token_store import FileTokenStore
+
+SyncTask = Callable[[CatalystWells, str], Any]
+
+
+@dataclass
+class SyncResult:
+    """
+    Result for one student.
+
+    ``data`` is a zero-copy view onto the worker's memory-mapped segment
+    file and is only valid while ``SyncOrchestrator.run`` is being iterated;
+    copy it with ``bytes(result.data)`` to keep it longer. Prefer consuming
+    the raw bytes (e.g. handing them to a bulk loader) over ``json()``, which
+    decodes in the parent process.
+    """
+    student_id: str
+    data: Optional[memoryview] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def json(self) -> Any:
+        """Decode ``data`` as JSON (in the calling process)."""
+        return json.loads(bytes(self.data)) if self.data is not None else None
+
+
+class SyncOrchestrator:
+    """
+    Run a task for many students across worker processes.
+
+    Every process builds its own ``CatalystWells`` client (and so its own
+    connection pool) from ``client_kwargs``, with a ``FileTokenStore`` at
+    ``token_path`` shared by all processes: the token is exchanged once and
+    refreshed by a single process while the others wait on the store's lock.
+
+    Student IDs are split into batches placed on per-process queues; a
+    process that drains its own queue steals batches from the others.
+
+    ``task(client, student_id)`` runs in the worker and may return ``bytes``,
+    ``str`` or any JSON-serialisable value. The encoded result is appended to
+    a per-process segment file and only its offset and length travel back
+    over the result queue; the parent gets a view onto the memory-mapped file
+    instead of a copy (see ``SyncResult``). Do decoding and transformation
+    inside ``task`` so it runs in the workers.
+
+    ``tokens`` (if given) are written to the token store before any worker
+    starts; otherwise ``token_path`` must already hold a token.
+    """
+
+    def __init__(
+        self,
+        task: SyncTask,
+        client_kwargs: Dict[str, Any],
+        token_path: str,
+        processes: Optional[int] = None,
+        threads_per_process: int = 4,
+        batch_size: int = 16,
+        encryption_key: Optional[Union[str, bytes]] = None,
+        tokens: Optional[Union[TokenResponse, Dict[str, Any]]] = None,
+        mp_context: Optional[str] = "spawn"
+    ):
+        self.task = task
+        self.client_kwargs = client_kwargs
+        self.token_path = token_path
+        self.processes = processes or os.cpu_count() or 1
+        self.threads_per_process = threads_per_process
+        self.batch_size = batch_size
+        self.encryption_key = encryption_key
+        self._ctx = multiprocessing.get_context(mp_context)
+
+        if tokens:
+            # Seed the shared store so workers start with a token
+            store = FileTokenStore(token_path, encryption_key=encryption_key)
+            with CatalystWells(token_store=store, **client_kwargs) as client:
+                client.set_tokens(tokens)
+
+    def run(self, student_ids: Iterable[str]) -> Iterator[SyncResult]:
+        """Process every student, yielding results as they complete."""
+        ids = list(student_ids)
+        batches = [ids[i:i + self.batch_size] for i in range(0, len(ids), self.batch_size)]
+        if not batches:
+            return
+
+        segment_dir = tempfile.mkdtemp(prefix="catalystwells-sync-")
+        work_queues = [self._ctx.Queue() for _ in range(self.processes)]
+        result_queue = self._ctx.Queue()
+        unclaimed = self._ctx.Value("i", len(batches))
+
+        for i, batch in enumerate(batches):
+            work_queues[i % self.processes].put(batch)
+
+        workers = [
+            self._ctx.Process(
+                target=_worker_main,
+                args=(
+                    index,
+                    self.task,
+                    self.client_kwargs,
+                    self.token_path,
+                    self.encryption_key,
+                    self.threads_per_process,
+                    work_queues,
+                    unclaimed,
+                    result_queue,
+                    os.path.join(segment_dir, f"worker-{index}.bin")
+                ),
+                daemon=True
+            )
+            for index in range(self.processes)
+        ]
+        for worker in workers:
+            worker.start()
+
+        segments = _SegmentReader(segment_dir)
+        try:
+            remaining = len(ids)
+            while remaining:
+                message = _get_result(result_queue, workers)
+                student_id, index, offset, length, error = message
+                if error is not None:
+                    yield SyncResult(student_id, error=error)
+                else:
+                    yield SyncResult(student_id, data=segments.read(index, offset, length))
+                remaining -= 1
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+            segments.close()
+            shutil.rmtree(segment_dir, ignore_errors=True)
+
+
+# ==================== Worker process ====================
+
+_ResultMessage = Tuple[str, int, int, int, Optional[str]]
+
+
+def _worker_main(
+    index: int,
+    task: SyncTask,
+    client_kwargs: Dict[str, Any],
+    token_path: str,
+    encryption_key: Optional[Union[str, bytes]],
+    threads: int,
+    work_queues: List["multiprocessing.Queue[List[str]]"],
+    unclaimed: Any,
+    result_queue: "multiprocessing.Queue[_ResultMessage]",
+    segment_path: str
+) -> None:
+    client = CatalystWells(
+        token_store=FileTokenStore(token_path, encryption_key=encryption_key),
+        **client_kwargs
+    )
+    write_lock = threading.Lock()
+
+    with client, open(segment_path, "ab") as segment, ThreadPoolExecutor(threads) as pool:
+        def handle(student_id: str) -> None:
+            try:
+                payload = _encode(task(client, student_id))
+            except Exception as e:
+                result_queue.put((student_id, index, 0, 0, f"{type(e).__name__}: {e}"))
+                return
+            with write_lock:
+                offset = segment.tell()
+                segment.write(payload)
+                segment.flush()
+            result_queue.put((student_id, index, offset, len(payload), None))
+
+        while True:
+            batch = _claim_batch(index, work_queues, unclaimed)
+            if batch is None:
+                return
+            list(pool.map(handle, batch))
+
+
+def _claim_batch(
+    index: int,
+    work_queues: List["multiprocessing.Queue[List[str]]"],
+    unclaimed: Any
+) -> Optional[List[str]]:
+    """Take a batch from our own queue, stealing from the others when it is empty."""
+    order = work_queues[index:] + work_queues[:index]
+    while True:
+        for i, work_queue in enumerate(order):
+            try:
+                batch = work_queue.get(timeout=0.05) if i == 0 else work_queue.get_nowait()
+            except queue.Empty:
+                continue
+            with unclaimed.get_lock():
+                unclaimed.value -= 1
+            return batch
+        if unclaimed.value <= 0:
+            return None
+
+
+def _encode(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    return json.dumps(value, separators=(",", ":"), default=str).encode()
+
+
+# ==================== Parent side ====================
+
+def _get_result(
+    result_queue: "multiprocessing.Queue[_ResultMessage]",
+    workers: List[Any]
+) -> _ResultMessage:
+    while True:
+        try:
+            return result_queue.get(timeout=1.0)
+        except queue.Empty:
+            if not any(worker.is_alive() for worker in workers):
+                raise RuntimeError("All sync workers exited before finishing the work")
+
+
+class _SegmentReader:
+    """Give zero-copy views onto the workers' segment files through memory maps."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._retired: List[mmap.mmap] = []
+        self._files: Dict[int, Any] = {}
+
+    def read(self, index: int, offset: int, length: int) -> memoryview:
+        if length == 0:
+            return memoryview(b"")
+        mapped = self._maps.get(index)
+        if mapped is None or offset + length > len(mapped):
+            # The segment has grown since we mapped it. Older maps stay open
+            # because views handed out earlier may still point into them.
+            if mapped is not None:
+                self._retired.append(mapped)
+            f = self._files.get(index)
+            if f is None:
+                f = self._files[index] = open(
+                    os.path.join(self.directory, f"worker-{index}.bin"), "rb"
+                )
+            mapped = self._maps[index] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped)[offset:offset + length]
+
+    def close(self) -> None:
+        for mapped in list(self._maps.values()) + self._retired:
+            try:
+                mapped.close()
+            except BufferError:
+                # A caller still holds a view; the map is freed with it
+                pass
+        for f in self._files.values():
+            f.close()
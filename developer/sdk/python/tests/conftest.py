@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catalystwells import CatalystWells  # noqa: E402
+from catalystwells.token_store import TokenStore  # noqa: E402
+
+TOKENS = {
+    "access_token": "access-1",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "student.profile.read",
+    "refresh_token": "refresh-1"
+}
+
+
+def make_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+    token_store: Optional[TokenStore] = None,
+    tokens: Optional[Dict[str, Any]] = None,
+    **kwargs: Any
+) -> CatalystWells:
+    """Build a client whose HTTP traffic goes to ``handler``."""
+    client = CatalystWells(client_id="test-client", token_store=token_store, **kwargs)
+    client._http = httpx.Client(transport=httpx.MockTransport(handler), timeout=30.0)
+    if tokens:
+        client.set_tokens(tokens)
+    return client
@@ -0,0 +1,71 @@
+import httpx
+import pytest
+
+from catalystwells import endpoints
+
+from conftest import TOKENS, make_client
+
+
+def test_encode_params_applies_schema():
+    assert endpoints.HOMEWORK.encode_params(
+        {"limit": 50, "student_id": "s1", "class_id": None, "upcoming": True, "overdue": False}
+    ) == {"limit": "50", "student_id": "s1", "upcoming": "true"}
+
+
+def test_encode_params_rejects_unknown_parameters():
+    with pytest.raises(TypeError):
+        endpoints.CURRENT_MOOD.encode_params({"student": "s1"})
+
+
+def test_url_template_fills_path_arguments():
+    template = endpoints.STUDENT_MARKS.url_template("https://api.test")
+    assert endpoints.STUDENT_MARKS.path_params == ("student_id",)
+    assert template.format("s1") == "https://api.test/api/v1/students/s1/marks"
+
+
+def test_idempotency_defaults():
+    assert endpoints.STUDENT.idempotent
+    assert not endpoints.SEND_NOTIFICATION.idempotent
+    assert not endpoints.SEND_BULK_NOTIFICATIONS.idempotent
+
+
+@pytest.mark.parametrize("call, expected", [
+    (lambda c: c.get_student("s1"), "https://sandbox.catalystwells.com/api/v1/students/s1"),
+    (
+        lambda c: c.get_student_attendance("s1", month="2024-01", limit=30),
+        "https://sandbox.catalystwells.com/api/v1/attendance/student/s1?month=2024-01&limit=30"
+    ),
+    (
+        lambda c: c.get_school("sc1", include=["grades", "terms"]),
+        "https://sandbox.catalystwells.com/api/v1/schools/sc1?include=grades%2Cterms"
+    ),
+    (
+        lambda c: c.get_current_mood(aggregated=True),
+        "https://sandbox.catalystwells.com/api/v1/wellbeing/mood/current?aggregated=true"
+    ),
+])
+def test_api_methods_build_expected_urls(call, expected):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    call(make_client(handler, tokens=TOKENS))
+    assert str(seen[0].url) == expected
+    assert seen[0].headers["authorization"] == "Bearer access-1"
+    assert "user-agent" in seen[0].headers
+
+
+def test_auth_header_follows_token_changes():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["authorization"])
+        return httpx.Response(200, json={})
+
+    client = make_client(handler, tokens=TOKENS)
+    client.get_current_student()
+    client.set_tokens({**TOKENS, "access_token": "access-2"})
+    client.get_current_student()
+    assert seen == ["Bearer access-1", "Bearer access-2"]
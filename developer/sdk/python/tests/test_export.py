@@ -0,0 +1,90 @@
+import io
+import json
+from datetime import date, timedelta
+
+import httpx
+import pytest
+
+from catalystwells import cli
+from catalystwells.export import SchoolExporter
+
+from conftest import TOKENS, make_client
+
+START = date(2024, 1, 1)
+ATTENDANCE = [
+    {"date": (START + timedelta(days=i)).isoformat(), "status": "present"} for i in range(250)
+][::-1]
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    params = request.url.params
+    if path.startswith("/api/v1/attendance/student/"):
+        records = [r for r in ATTENDANCE if r["date"] <= params.get("end_date", "9999")]
+        return httpx.Response(200, json={"records": records[:int(params["limit"])]})
+    if path.endswith("/marks"):
+        return httpx.Response(200, json={"subjects": [{"subject": {"name": "Maths"}}]})
+    if path == "/api/v1/homework":
+        grade = "A" if params["student_id"] == "s1" else 5
+        return httpx.Response(200, json={"homework": [{"id": "h1", "priority": grade}]})
+    return httpx.Response(200, json={"id": path.rsplit("/", 1)[-1], "roll_number": 3})
+
+
+def exporter(tmp_path, **kwargs) -> SchoolExporter:
+    return SchoolExporter(
+        make_client(handler, tokens=TOKENS), str(tmp_path), log=io.StringIO(), **kwargs
+    )
+
+
+def read_ndjson(directory) -> list:
+    rows = []
+    for part in sorted(directory.iterdir()):
+        rows.extend(json.loads(line) for line in part.read_text().splitlines())
+    return rows
+
+
+def test_attendance_is_paged_completely(tmp_path):
+    stats = exporter(tmp_path, datasets=["attendance"], page_size=100).run(["s1"])
+
+    rows = read_ndjson(tmp_path / "attendance")
+    assert stats.errors == 0
+    assert len(rows) == len(ATTENDANCE)
+    assert len({r["date"] for r in rows}) == len(ATTENDANCE)
+
+
+def test_full_homework_page_fails_instead_of_truncating(tmp_path):
+    stats = exporter(tmp_path, datasets=["homework"], homework_limit=1).run(["s1"])
+
+    assert stats.errors == 1
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert "s1" not in checkpoint["done"].get("homework", [])
+
+
+def test_resume_skips_finished_students(tmp_path):
+    exporter(tmp_path, datasets=["students"], chunk_size=1).run(["s1", "s2"])
+    stats = exporter(tmp_path, datasets=["students"]).run(["s1", "s2", "s3"])
+
+    assert stats.students == 1
+    assert [r["id"] for r in read_ndjson(tmp_path / "students")] == ["s1", "s2", "s3"]
+
+
+def test_parquet_parts_share_one_schema(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    exporter(tmp_path, format="parquet", chunk_size=1).run(["s1", "s2"])
+
+    for dataset in ("students", "attendance", "marks", "homework"):
+        table = pq.read_table(str(tmp_path / dataset))
+        assert {str(t) for t in table.schema.types} == {"string"}
+    homework = pq.read_table(str(tmp_path / "homework")).to_pydict()
+    assert sorted(homework["priority"]) == ["5", "A"]
+
+
+def test_cli_rejects_access_token_with_token_file(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        cli.main([
+            "--client-id", "c",
+            "--access-token", "a",
+            "--token-file", str(tmp_path / "token.json"),
+            "export", "--class", "c1"
+        ])
+    assert "not allowed with argument" in capsys.readouterr().err
@@ -0,0 +1,75 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from catalystwells import HedgingPolicy, LatencyHistogram
+
+from conftest import TOKENS, make_client
+
+SUMMARY = "/api/v1/wellbeing/behavior/summary"
+
+
+def test_histogram_percentile():
+    histogram = LatencyHistogram()
+    for _ in range(95):
+        histogram.record(0.005)
+    for _ in range(5):
+        histogram.record(1.0)
+    assert 0.005 <= histogram.percentile(0.95) < 0.01
+    assert histogram.percentile(0.99) >= 1.0
+
+
+def test_slow_request_is_hedged_with_separate_request():
+    lock = threading.Lock()
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            seen.append(request)
+            n = len(seen)
+        time.sleep(2.0 if n == 31 else 0.002)
+        return httpx.Response(200, json={"n": n})
+
+    client = make_client(
+        handler, tokens=TOKENS, hedging=HedgingPolicy(budget=0.5, endpoints=frozenset({SUMMARY}))
+    )
+    for _ in range(30):
+        client.get_behavior_summary(class_id="c1")
+
+    start = time.monotonic()
+    assert client.get_behavior_summary(class_id="c1") == {"n": 32}
+    assert time.monotonic() - start < 1.0
+    assert client._hedger.hedges == 1
+    assert seen[30] is not seen[31]
+    assert seen[30].url == seen[31].url
+    assert SUMMARY in client.latency_histograms
+
+
+def test_ineligible_endpoints_are_not_hedged():
+    client = make_client(
+        lambda request: httpx.Response(200, json={}),
+        tokens=TOKENS,
+        hedging=HedgingPolicy(endpoints=frozenset({SUMMARY}))
+    )
+    client.get_current_student()
+    client.send_notification("u1", "t", "m")
+    assert client.latency_histograms == {}
+
+
+def test_saturated_pool_does_not_queue_requests():
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.02)
+        return httpx.Response(200, json={})
+
+    client = make_client(
+        handler, tokens=TOKENS, hedging=HedgingPolicy(min_samples=1, max_workers=4)
+    )
+    client.get_behavior_summary()
+    client.get_behavior_summary()
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(32) as callers:
+        list(callers.map(lambda _: client.get_behavior_summary(), range(32)))
+    assert time.monotonic() - start < 0.3
@@ -0,0 +1,135 @@
+import multiprocessing
+import os
+import stat
+import sys
+import time
+
+import httpx
+import pytest
+
+from catalystwells import FileTokenStore, MemoryTokenStore, SQLiteTokenStore, StoredToken
+from catalystwells.token_store import TokenStore
+
+from conftest import TOKENS, make_client
+
+
+def api_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/api/oauth/token":
+        return httpx.Response(200, json={**TOKENS, "access_token": "refreshed"})
+    if request.url.path == "/api/oauth/revoke":
+        return httpx.Response(200, json={})
+    return httpx.Response(200, json={"authorization": request.headers.get("authorization")})
+
+
+def expired_token() -> StoredToken:
+    return StoredToken(access_token="stale", expires_at=time.time() - 10, refresh_token="refresh-1")
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def store(request, tmp_path) -> TokenStore:
+    if request.param == "memory":
+        return MemoryTokenStore()
+    if request.param == "file":
+        return FileTokenStore(tmp_path / "token.json")
+    return SQLiteTokenStore(tmp_path / "tokens.db")
+
+
+def test_incomplete_subclass_fails_on_creation():
+    class Incomplete(TokenStore):
+        def load(self):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_tokens_are_persisted_and_loaded_lazily(store):
+    make_client(api_handler, token_store=store, tokens=TOKENS)
+
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        return api_handler(request)
+
+    client = make_client(handler, token_store=store)
+    assert client._access_token is None
+    assert client.get_current_student() == {"authorization": "Bearer access-1"}
+    assert seen == ["/api/v1/students/me"]
+
+
+def test_expired_stored_token_is_refreshed_and_saved(store):
+    store.save(expired_token())
+    client = make_client(api_handler, token_store=store)
+
+    assert client.get_current_student() == {"authorization": "Bearer refreshed"}
+    assert store.load().access_token == "refreshed"
+
+
+def test_revoke_clears_store(store):
+    store.save(StoredToken(access_token="a", expires_at=time.time() + 3600))
+    make_client(api_handler, token_store=store).revoke_token()
+    assert store.load() is None
+
+
+def test_encrypted_round_trip(tmp_path):
+    fernet = pytest.importorskip("cryptography.fernet")
+    key = fernet.Fernet.generate_key()
+    token = StoredToken(access_token="secret-access", expires_at=123.0, refresh_token="r")
+
+    for store in (
+        FileTokenStore(tmp_path / "token.json", encryption_key=key),
+        SQLiteTokenStore(tmp_path / "tokens.db", encryption_key=key)
+    ):
+        store.save(token)
+        assert store.load() == token
+
+    assert b"secret-access" not in (tmp_path / "token.json").read_bytes()
+    other_key = fernet.Fernet.generate_key()
+    assert FileTokenStore(tmp_path / "token.json", encryption_key=other_key).load() is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+def test_stores_are_private_to_owner(tmp_path):
+    token = StoredToken(access_token="a", expires_at=123.0, refresh_token="r")
+    old_umask = os.umask(0o022)
+    try:
+        FileTokenStore(tmp_path / "token.json").save(token)
+        SQLiteTokenStore(tmp_path / "tokens.db").save(token)
+    finally:
+        os.umask(old_umask)
+
+    for name in ("token.json", "tokens.db"):
+        assert stat.S_IMODE((tmp_path / name).stat().st_mode) == 0o600
+
+
+def _refresh_in_process(path: str, log_path: str) -> None:
+    def handler(request):
+        if request.url.path == "/api/oauth/token":
+            with open(log_path, "a") as f:
+                f.write("refresh\n")
+            time.sleep(0.2)
+        return api_handler(request)
+
+    client = make_client(handler, token_store=FileTokenStore(path))
+    assert client.get_current_student() == {"authorization": "Bearer refreshed"}
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+def test_single_refresh_across_processes(tmp_path):
+    path = str(tmp_path / "token.json")
+    log_path = str(tmp_path / "refreshes.log")
+    FileTokenStore(path).save(expired_token())
+
+    ctx = multiprocessing.get_context("fork")
+    processes = [ctx.Process(target=_refresh_in_process, args=(path, log_path)) for _ in range(4)]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join(timeout=30)
+        assert p.exitcode == 0
+
+    with open(log_path) as f:
+        assert f.read().count("refresh") == 1
@@ -0,0 +1,183 @@
+import asyncio
+import json
+import time
+
+import httpx
+
+from catalystwells import ChangePoller, WebhookEvent, WebhookReceiver
+from catalystwells.webhooks import compute_signature
+
+from conftest import TOKENS, make_client
+
+SECRET = "whsec_test"
+
+
+async def deliver(receiver, body: bytes, signature: str, timestamp=None):
+    messages = [{"type": "http.request", "body": body}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    headers = [
+        (b"x-catalystwells-signature", signature.encode()),
+        (b"x-catalystwells-timestamp", str(timestamp or int(time.time())).encode())
+    ]
+    await receiver({"type": "http", "method": "POST", "headers": headers}, receive, send)
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+def payload(event_id: str = "evt_1", event: str = "wellness.alert") -> bytes:
+    return json.dumps({"id": event_id, "event": event, "data": {"student_id": "s1"}}).encode()
+
+
+async def test_signed_delivery_is_dispatched_once():
+    receiver = WebhookReceiver(SECRET)
+    handled = []
+
+    @receiver.on("wellness.alert")
+    async def on_alert(event: WebhookEvent) -> None:
+        handled.append(event.id)
+
+    body = payload()
+    assert await deliver(receiver, body, compute_signature(body, SECRET)) == (
+        202, {"received": True, "duplicate": False}
+    )
+    assert await deliver(receiver, body, compute_signature(body, SECRET)) == (
+        202, {"received": True, "duplicate": True}
+    )
+    await receiver.stop()
+    assert handled == ["evt_1"]
+
+
+async def test_rejects_bad_signature_and_stale_timestamp():
+    receiver = WebhookReceiver(SECRET)
+    body = payload()
+
+    status, _ = await deliver(receiver, body, "0" * 64)
+    assert status == 401
+    status, _ = await deliver(
+        receiver, body, compute_signature(body, SECRET), timestamp=int(time.time()) - 3600
+    )
+    assert status == 401
+
+
+async def test_full_queue_answers_503():
+    receiver = WebhookReceiver(SECRET, workers=1, max_queue_size=1)
+    release = asyncio.Event()
+
+    @receiver.on("*")
+    async def slow(event: WebhookEvent) -> None:
+        await release.wait()
+
+    statuses = []
+    for i in range(3):
+        body = payload(f"evt_{i}")
+        statuses.append((await deliver(receiver, body, compute_signature(body, SECRET)))[0])
+        await asyncio.sleep(0)
+    assert statuses == [202, 202, 503]
+    release.set()
+    await receiver.stop()
+
+
+def test_poller_emits_each_change_even_when_content_repeats():
+    states = iter(["A", "A", "B", "A", "B"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"mood": next(states)})
+
+    poller = ChangePoller(make_client(handler, tokens=TOKENS))
+    poller.watch_mood(student_id="s1")
+
+    events = [e for _ in range(5) for e in poller.poll_once()]
+    assert [e.data["result"]["mood"] for e in events] == ["B", "A", "B"]
+    assert len({e.id for e in events}) == 3
+
+    async def submit_all():
+        receiver = WebhookReceiver(SECRET)
+        accepted = [await receiver.submit(e) for e in events]
+        await receiver.stop()
+        return accepted
+
+    assert asyncio.run(submit_all()) == [True, True, True]
+
+
+def test_poller_uses_conditional_requests():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"items": []}, headers={"ETag": '"v1"'})
+
+    poller = ChangePoller(make_client(handler, tokens=TOKENS))
+    poller.watch_announcements(school_id="school-1")
+
+    assert poller.poll_once() == []
+    assert poller.poll_once() == []
+    assert seen == [None, '"v1"']
+
+
+def test_poller_keeps_watches_on_the_same_path_apart():
+    moods = {"s1": iter(["A", "B"]), "s2": iter(["A", "B"])}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"mood": next(moods[request.url.params["student_id"]])})
+
+    poller = ChangePoller(make_client(handler, tokens=TOKENS))
+    poller.watch_mood(student_id="s1")
+    poller.watch_mood(student_id="s2")
+
+    assert poller.poll_once() == []
+    events = poller.poll_once()
+    assert [e.data["params"]["student_id"] for e in events] == ["s1", "s2"]
+
+    async def submit_all():
+        receiver = WebhookReceiver(SECRET)
+        accepted = [await receiver.submit(e) for e in events]
+        await receiver.stop()
+        return accepted
+
+    assert asyncio.run(submit_all()) == [True, True]
+
+
+def test_failing_watch_does_not_lose_other_changes():
+    moods = iter(["A", "B", "C"])
+    announcement_status = iter([200, 500, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/announcements"):
+            status = next(announcement_status)
+            if status != 200:
+                return httpx.Response(status, json={"error": "server_error"})
+            return httpx.Response(200, json={"items": []})
+        return httpx.Response(200, json={"mood": next(moods)})
+
+    poller = ChangePoller(make_client(handler, tokens=TOKENS))
+    poller.watch_announcements(school_id="school-1")
+    poller.watch_mood(student_id="s1")
+
+    assert poller.poll_once() == []
+    assert [e.data["result"]["mood"] for e in poller.poll_once()] == ["B"]
+    assert [e.data["result"]["mood"] for e in poller.poll_once()] == ["C"]
+
+
+async def test_run_keeps_polling_after_an_error():
+    calls = []
+
+    def poll_once():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return []
+
+    poller = ChangePoller(make_client(lambda r: httpx.Response(200, json={}), tokens=TOKENS), 0)
+    poller.poll_once = poll_once
+    task = asyncio.create_task(poller.run(WebhookReceiver(SECRET)))
+    while len(calls) < 3:
+        await asyncio.sleep(0.01)
+    task.cancel()
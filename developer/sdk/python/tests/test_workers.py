@@ -0,0 +1,48 @@
+import json
+
+from catalystwells import CatalystWells, FileTokenStore, SyncOrchestrator
+
+from conftest import TOKENS
+
+
+def transform(client: CatalystWells, student_id: str) -> dict:
+    if student_id == "bad":
+        raise ValueError("no such student")
+    return {"student_id": student_id, "token": client._ensure_access_token(), "pad": "x" * 4096}
+
+
+def test_results_come_back_through_shared_segments(tmp_path):
+    token_path = str(tmp_path / "token.json")
+    orchestrator = SyncOrchestrator(
+        transform,
+        client_kwargs={"client_id": "test-client"},
+        token_path=token_path,
+        processes=2,
+        threads_per_process=2,
+        batch_size=3,
+        tokens=TOKENS
+    )
+    student_ids = [f"s{i}" for i in range(20)] + ["bad"]
+
+    results = {}
+    for result in orchestrator.run(student_ids):
+        if result.ok:
+            assert isinstance(result.data, memoryview)
+        results[result.student_id] = result.json() if result.ok else result.error
+
+    assert set(results) == set(student_ids)
+    assert results["bad"] == "ValueError: no such student"
+    assert all(results[s]["token"] == "access-1" for s in student_ids if s != "bad")
+    assert FileTokenStore(token_path).load().access_token == "access-1"
+
+
+def test_copied_data_outlives_the_run(tmp_path):
+    orchestrator = SyncOrchestrator(
+        transform,
+        client_kwargs={"client_id": "test-client"},
+        token_path=str(tmp_path / "token.json"),
+        processes=1,
+        tokens=TOKENS
+    )
+    kept = [bytes(r.data) for r in orchestrator.run(["s1", "s2"])]
+    assert sorted(json.loads(b)["student_id"] for b in kept) == ["s1", "s2"]